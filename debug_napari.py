@@ -1,28 +1,24 @@
 #!/usr/bin/env python
 """Debug script for napari GUI."""
 
+import functools
 import os
 import sys
 
 import napari
 import json
 
-# Load user_paths.json
-desktop_path = os.path.join(os.environ.get("USERPROFILE", os.environ.get("HOME")), "Desktop")
-with open(os.path.join(desktop_path, "user_paths.json"), "r") as f:
-    paths = json.load(f)
-    
-user = "Akseli"
-movformer_folder = paths[user].get("movformer_folder")
 
-sys.path.insert(0, movformer_folder)
-
-
-
-from movformer_gui.meta_widget import MetaWidget
-
-# Add src directory to path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+@functools.lru_cache(maxsize=1)
+def _load_user_paths():
+    """Read user_paths.json from the Desktop once; return {} if it does not exist."""
+    desktop_path = os.path.join(os.environ.get("USERPROFILE", os.environ.get("HOME")), "Desktop")
+    paths_file = os.path.join(desktop_path, "user_paths.json")
+    if not os.path.exists(paths_file):
+        print(f"DEBUG: {paths_file} not found, using installed packages")
+        return {}
+    with open(paths_file, "r") as f:
+        return json.load(f)
 
 
 def main():
@@ -46,6 +42,16 @@ def main():
     # Suppress Qt warnings at the OS level
     os.environ["QT_LOGGING_RULES"] = "qt.*=false"
 
+    user = "Akseli"
+    movformer_folder = _load_user_paths().get(user, {}).get("movformer_folder")
+
+    # Make movformer importable when it is not installed; appended so it does not
+    # lengthen the search for every other import
+    if movformer_folder and movformer_folder not in sys.path:
+        sys.path.append(movformer_folder)
+
+    from movformer_gui.meta_widget import MetaWidget
+
     # Start napari viewer
     viewer = napari.Viewer()
 
@@ -0,0 +1,77 @@
+import math
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+app_state = pytest.importorskip("movformer_gui.app_state")
+
+
+STATE = {
+    "none_value": None,
+    "flag_on": True,
+    "flag_off": False,
+    "zero": 0,
+    "negative": -3,
+    "ratio": 1.5,
+    "negative_zero": -0.0,
+    "tiny": 1e-05,
+    "huge": 1e20,
+    "not_a_number": math.nan,
+    "pos_inf": math.inf,
+    "neg_inf": -math.inf,
+    "word": "trial_1",
+    "path": "videos/cam.1.mp4",
+    "str_true": "true",
+    "str_false": "False",
+    "str_null": "null",
+    "str_yes": "yes",
+    "str_tilde": "~",
+    "str_float": "1.0",
+    "str_int": "42",
+    "str_nan": ".nan",
+    "str_neg_inf": "-.inf",
+    "empty": "",
+    "colon": "a: b",
+    "quotes": 'say "hi"',
+    "backslash": "C:\\data\\x",
+    "unicode": "süße",
+}
+
+
+def _assert_same(loaded, expected):
+    assert list(loaded) == list(expected)
+    for key, value in expected.items():
+        got = loaded[key]
+        assert type(got) is type(value), key
+        if isinstance(value, float) and math.isnan(value):
+            assert math.isnan(got), key
+        else:
+            assert got == value, key
+            if isinstance(value, float):
+                assert math.copysign(1.0, got) == math.copysign(1.0, value), key
+
+
+def test_flat_yaml_round_trip():
+    text = app_state._dump_flat_yaml(STATE)
+    _assert_same(app_state._load_flat_yaml(text), STATE)
+
+
+def test_flat_yaml_matches_pyyaml():
+    # Files must stay readable by the PyYAML fallback and other tools
+    text = app_state._dump_flat_yaml(STATE)
+    _assert_same(yaml.safe_load(text), STATE)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "trials:\n- 1\n- 2\n",
+        "trials: [1, 2]\n",
+        "# comment\nword: x\n",
+        "word: 'single quoted'\n",
+        "nested:\n  key: 1\n",
+    ],
+)
+def test_load_flat_yaml_falls_back(text):
+    # Lists and other YAML outside the flat subset are left to PyYAML
+    assert app_state._load_flat_yaml(text) is None
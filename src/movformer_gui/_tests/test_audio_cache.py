@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("audioio")
+pytest.importorskip("qtpy")
+audio_cache = pytest.importorskip("movformer_gui.audio_cache")
+SharedAudioCache = audio_cache.SharedAudioCache
+
+
+class FakeLoader:
+    """Stands in for AudioLoader; records whether it was closed."""
+
+    def __init__(self, path, buffersize=10.0):
+        if path.startswith("missing"):
+            raise OSError(path)
+        self.path = path
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(audio_cache, "AudioLoader", FakeLoader)
+    monkeypatch.setattr(SharedAudioCache, "_instances", OrderedDict())
+    monkeypatch.setattr(SharedAudioCache, "_MAX", 3)
+    return SharedAudioCache
+
+
+def test_evicts_least_recently_used(cache):
+    loaders = {path: cache.get_loader(path) for path in ("a.wav", "b.wav", "c.wav")}
+    # A hit refreshes a.wav, so b.wav is now the oldest entry
+    assert cache.get_loader("a.wav") is loaders["a.wav"]
+
+    cache.get_loader("d.wav")
+
+    assert list(cache._instances) == ["c.wav", "a.wav", "d.wav"]
+    # Evicted loaders may still be in use elsewhere, so they stay open
+    assert not loaders["b.wav"].closed
+    assert cache.get_loader("b.wav") is not loaders["b.wav"]
+    assert list(cache._instances) == ["a.wav", "d.wav", "b.wav"]
+
+
+def test_failed_load_is_not_cached(cache):
+    assert cache.get_loader("missing.wav") is None
+    assert cache.get_loader("") is None
+    assert len(cache._instances) == 0
+
+
+def test_remove_and_clear(cache):
+    cache.get_loader("a.wav")
+    cache.get_loader("b.wav")
+    cache.remove_loader("a.wav")
+    cache.remove_loader("never-loaded.wav")
+    assert list(cache._instances) == ["b.wav"]
+    cache.clear_cache()
+    assert len(cache._instances) == 0
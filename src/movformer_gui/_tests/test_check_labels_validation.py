@@ -0,0 +1,41 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("xarray")
+
+# check_labels_validation.py is a standalone script at the repository root
+_SCRIPT = Path(__file__).resolve().parents[3] / "check_labels_validation.py"
+if not _SCRIPT.exists():
+    pytest.skip("check_labels_validation.py not available", allow_module_level=True)
+_spec = importlib.util.spec_from_file_location("check_labels_validation", _SCRIPT)
+check_labels_validation = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_labels_validation)
+_is_all_integral = check_labels_validation._is_all_integral
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([0.0, 1.0, -2.0, 1e15], True),
+        ([0.0, 1.5], False),
+        ([-0.5], False),
+        ([1.0, np.nan], False),
+        ([np.inf], False),
+        ([1.0, -np.inf], False),
+        ([], True),
+    ],
+)
+def test_is_all_integral(values, expected):
+    assert _is_all_integral(np.array(values, dtype=float)) is expected
+
+
+@pytest.mark.parametrize("values", [[1.0, 2.0], [0.5], [np.nan], [np.inf], [-np.inf, 3.0]])
+def test_is_all_integral_matches_mod_check(values):
+    # Same verdict as the np.mod(labels, 1) == 0 check it replaced
+    a = np.array(values, dtype=float)
+    with np.errstate(invalid="ignore"):
+        expected = bool(np.all(np.equal(np.mod(a, 1), 0)))
+    assert _is_all_integral(a) is expected
@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+labels_widget = pytest.importorskip("movformer_gui.labels_widget")
+
+
+def _loop_motif_runs(labels):
+    """Segments as found by the per-sample loop that _motif_runs replaced."""
+    runs = []
+    current_motif_id = 0
+    segment_start = None
+    for i, label in enumerate(labels):
+        if label != 0:
+            if label != current_motif_id:
+                if current_motif_id != 0 and segment_start is not None:
+                    runs.append((segment_start, i - 1, current_motif_id))
+                current_motif_id = label
+                segment_start = i
+        else:
+            if current_motif_id != 0 and segment_start is not None:
+                runs.append((segment_start, i - 1, current_motif_id))
+                current_motif_id = 0
+                segment_start = None
+    if current_motif_id != 0 and segment_start is not None:
+        runs.append((segment_start, len(labels) - 1, current_motif_id))
+    return runs
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        [],
+        [0],
+        [3],
+        [0, 0, 0, 0],
+        [1, 1, 2, 2, 0, 3],
+        [2, 5, 2],
+        [0, 4, 4, 0, 0, 4, 0],
+        [1, 1, 1, 1],
+        [0, 0, 7],
+    ],
+)
+def test_motif_runs_matches_loop(labels):
+    starts, ends, motif_ids = labels_widget._motif_runs(np.array(labels, dtype=int))
+    runs = [(int(s), int(e), int(m)) for s, e, m in zip(starts, ends, motif_ids, strict=True)]
+    assert runs == _loop_motif_runs(labels)
+
+
+def test_motif_runs_float_labels():
+    starts, ends, motif_ids = labels_widget._motif_runs(np.array([0.0, 2.0, 2.0, 1.0]))
+    assert starts.tolist() == [1, 3]
+    assert ends.tolist() == [2, 3]
+    assert motif_ids.tolist() == [2.0, 1.0]
@@ -1,20 +1,162 @@
 """Refactored observable application state with napari video sync support."""
 
+import json
+import logging
+import math
+import os
+import re
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 import xarray as xr
 import yaml
 from napari.settings import get_settings
-from qtpy.QtCore import QObject, QTimer, Signal
+from qtpy.QtCore import QMutex, QMutexLocker, QObject, QRunnable, QThreadPool, QTimer, Signal
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for attribute lookups where None is a valid value
+_MISSING = object()
+
+# Strings that can be written unquoted without YAML reading them back as another type
+_YAML_PLAIN_STR = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_YAML_RESERVED = {"true", "false", "yes", "no", "on", "off", "null"}
+
+
+def _yaml_scalar(value) -> str:
+    """Format a str/float/int/bool/None value as a YAML scalar."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 floats need a dot, e.g. 1e-05 -> 1.0e-05
+        if "." not in text:
+            text = text.replace("e", ".0e")
+        return text
+    text = str(value)
+    if _YAML_PLAIN_STR.fullmatch(text) and text.lower() not in _YAML_RESERVED:
+        return text
+    # JSON string escapes are valid YAML double-quoted escapes
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _dump_flat_yaml(state_dict: dict) -> str:
+    """Serialize a flat dict of scalars to YAML, preserving key order."""
+    return "".join(f"{key}: {_yaml_scalar(value)}\n" for key, value in state_dict.items())
+
+
+# Number forms that PyYAML and Python parse identically
+_YAML_INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_YAML_FLOAT = re.compile(r"-?(?:0|[1-9][0-9]*)\.[0-9]+(?:[eE][-+][0-9]+)?")
+_YAML_SPECIAL = {"true": True, "false": False, "null": None, ".inf": math.inf, "-.inf": -math.inf, ".nan": math.nan}
+
+
+def _load_flat_yaml(text: str) -> dict | None:
+    """Parse the subset of YAML written by _dump_flat_yaml.
+
+    Returns None for anything outside that subset (comments, other quoting,
+    nesting, ...), so the caller can fall back to a full YAML parser.
+    """
+    state_dict = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        key, sep, raw = line.partition(": ")
+        if not sep or not _YAML_PLAIN_STR.fullmatch(key) or key.lower() in _YAML_RESERVED:
+            return None
+        raw = raw.strip()
+        if raw in _YAML_SPECIAL:
+            value = _YAML_SPECIAL[raw]
+        elif raw.startswith('"'):
+            try:
+                value = json.loads(raw)
+            except ValueError:
+                return None
+            if not isinstance(value, str):
+                return None
+        elif _YAML_INT.fullmatch(raw):
+            value = int(raw)
+        elif _YAML_FLOAT.fullmatch(raw):
+            value = float(raw)
+        elif _YAML_PLAIN_STR.fullmatch(raw) and raw.lower() not in _YAML_RESERVED:
+            value = raw
+        else:
+            return None
+        state_dict[key] = value
+    return state_dict
+
+
+# Serializes state file writes between the GUI thread and the writer pool
+_yaml_write_mutex = QMutex()
+
+
+def _write_text_atomic(path: str, text: str, fsync: bool = False):
+    """Write text to a temporary file and rename it over path.
+
+    With fsync, the data is flushed to disk before the rename for crash safety.
+    """
+    tmp_path = f"{path}.tmp"
+    data = text.encode("utf-8")
+    with QMutexLocker(_yaml_write_mutex):
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+class _YamlWriteSignals(QObject):
+    """Reports a background write back to the GUI thread: (path, state_dict, dirty_gen, ok)."""
+
+    finished = Signal(str, object, int, bool)
+
+
+class _YamlWriteTask(QRunnable):
+    """Write already-serialized state to disk off the GUI thread."""
+
+    def __init__(self, path: str, text: str, state_dict: dict, dirty_gen: int,
+                 signals: _YamlWriteSignals, fsync: bool = False):
+        super().__init__()
+        self.path = path
+        self.text = text
+        self.state_dict = state_dict
+        self.dirty_gen = dirty_gen
+        self.signals = signals
+        self.fsync = fsync
+
+    def run(self):
+        try:
+            _write_text_atomic(self.path, self.text, self.fsync)
+            ok = True
+        except OSError as e:
+            logger.error("Error saving state to YAML: %s", e)
+            ok = False
+        self.signals.finished.emit(self.path, self.state_dict, self.dirty_gen, ok)
 
 
 class AppStateSpec:
     @classmethod
     def get_default(cls, key):
         """Return the default value for a given key from VARS."""
-        if key in cls.VARS:
-            return cls.VARS[key][1]
+        if key in cls.DEFAULTS:
+            return cls.DEFAULTS[key]
         raise KeyError(f"No default for key: {key}")
 
     # Variable name: (type, default, save_to_yaml, signal_type)
@@ -25,7 +167,7 @@ class AppStateSpec:
         "num_frames": (int, 0, False, int),
         "_info_data": (dict[str, Any], {}, False, object),
         "sync_state": (str | None, None, False, object),        
-        "window_size": (float, 2.0, True, object),
+        "window_size": (float, 2.0, True, float),
         "audio_buffer": (float | None, None, True, float),
 
         # Data
@@ -68,51 +210,191 @@ class AppStateSpec:
         "lock_axes": (bool, False, False, bool), # always started unlocked
     }
 
+    # Variables whose change check uses identity instead of equality: datasets
+    # and containers, where == is element-wise or walks the whole structure
+    IDENTITY_VARS = frozenset({"ds", "dt", "trials", "_info_data"})
+
+    # Column views of VARS, built once so hot loops don't unpack tuples
+    TYPES = {k: t for k, (t, _, _, _) in VARS.items()}
+    DEFAULTS = {k: d for k, (_, d, _, _) in VARS.items()}
+    SIGNAL_TYPES = {k: sig for k, (_, _, _, sig) in VARS.items()}
+
+    # Variables written to the settings YAML
+    SAVEABLE = frozenset(k for k, (_, _, save, _) in VARS.items() if save)
+
+    # Variables stored as plain Python floats (numpy scalars/ints are cast on set)
+    FLOAT_VARS = frozenset(k for k, t in TYPES.items() if t in (float, float | None))
+
 
 class AppState:
+    # Fixed attribute set: slot access, no per-instance __dict__
+    __slots__ = tuple(AppStateSpec.VARS)
+
     def __init__(self):
-        for var, (var_type, default, _, _) in AppStateSpec.VARS.items():
+        for var, default in AppStateSpec.DEFAULTS.items():
             setattr(self, var, default)
 
-    def saveable_attributes(self) -> set[str]:
-        return {k for k, (_, _, save, _) in AppStateSpec.VARS.items() if save}
+    def saveable_attributes(self) -> frozenset[str]:
+        return AppStateSpec.SAVEABLE
+
+
+def _to_float(value):
+    """Return value as a Python float, skipping the cast when it already is one."""
+    if value is None or type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _coerce_scalar(value):
+    """Return value as a plain Python scalar if possible, unwrapping numpy scalars."""
+    if type(value) in _SCALAR_TYPES:
+        return value
+    item = getattr(value, "item", None)
+    if item is not None:
+        try:
+            return item()
+        except (TypeError, ValueError):
+            pass
+    return value
+
+
+def _make_state_property(name: str, cast=None) -> property:
+    """Build the property that proxies a state variable to AppState.
+
+    If given, cast is applied to every assigned value before it is stored.
+    """
+
+    def getter(self):
+        return getattr(self._state, name)
+
+    if cast is None:
+        def setter(self, value):
+            self._set_state_var(name, value)
+    else:
+        def setter(self, value):
+            self._set_state_var(name, cast(value))
+
+    return property(getter, setter, doc=f"State variable '{name}' (see AppStateSpec.VARS).")
+
+
+def _ds_cached(func):
+    """Read-only property cached until the dataset (ds) is replaced.
+
+    The value is stored as (ds version, value) and recomputed when
+    ObservableAppState._ds_version has moved on.
+    """
+    name = func.__name__
+
+    def getter(self):
+        cached = self._ds_cache.get(name)
+        if cached is not None and cached[0] == self._ds_version:
+            return cached[1]
+        value = func(self)
+        self._ds_cache[name] = (self._ds_version, value)
+        return value
+
+    return property(getter, doc=func.__doc__)
+
+
+_STATE_KEYS = frozenset(AppStateSpec.VARS)
+_SEL_SUFFIXES = ("_sel", "_sel_previous")
 
 
 class ObservableAppState(QObject):
 
-    """State container with change notifications and computed properties."""
+    """State container with change notifications and computed properties.
 
-    # Signals for state changes
-    for var, (_, _, _, signal_type) in AppStateSpec.VARS.items():
+    Connect to signals with the functor form (``state.ymin_changed.connect(slot)``);
+    string-based SIGNAL("...") connects are not used in this package.
+    """
+
+    # Signals and properties for state variables, plus name -> setter / signal maps
+    _STATE_SETTERS = {}
+    _SIGNAL_GETTERS = {}
+    for var, signal_type in AppStateSpec.SIGNAL_TYPES.items():
         locals()[f"{var}_changed"] = Signal(signal_type)
+        locals()[var] = _make_state_property(
+            var, _to_float if var in AppStateSpec.FLOAT_VARS else None
+        )
+        _STATE_SETTERS[var] = locals()[var].fset
+        _SIGNAL_GETTERS[var] = attrgetter(f"{var}_changed")
 
     data_updated = Signal()
 
 
-    def __init__(self, yaml_path: str | None = None, auto_save_interval: int = 30000):
+    def __init__(
+        self,
+        yaml_path: str | None = None,
+        auto_save_debounce_ms: int = 2000,
+        auto_save_max_interval_ms: int = 30000,
+    ):
         super().__init__()
         object.__setattr__(self, "_state", AppState())
+        self._dirty = False
+        # Bumped by every _mark_dirty(), so a finished write only clears _dirty
+        # if nothing changed while it was in flight
+        self._dirty_gen = 0
+        self._cached_save_dict: dict | None = None
+        # (path, state dict) of the last write or load, to skip identical rewrites
+        self._last_saved: tuple[str, dict] | None = None
+        # Names of the dynamic *_sel / *_sel_previous attributes set so far
+        self._sel_keys: set[str] = set()
 
-        self.settings = get_settings()
         self._yaml_path = yaml_path or "gui_settings.yaml"
+        # Single writer thread keeps saves in order, so the newest state lands last
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
+        self._write_signals = _YamlWriteSignals()
+        self._write_signals.finished.connect(self._on_yaml_written)
+
+        # Autosave runs after changes only: auto_save_debounce_ms after the last
+        # change, and at most auto_save_max_interval_ms after the first unsaved one
+        self._auto_save_enabled = True
         self._auto_save_timer = QTimer()
+        self._auto_save_timer.setSingleShot(True)
+        self._auto_save_timer.setInterval(auto_save_debounce_ms)
         self._auto_save_timer.timeout.connect(self.save_to_yaml)
-        self._auto_save_timer.start(auto_save_interval)
+        self._max_save_timer = QTimer()
+        self._max_save_timer.setSingleShot(True)
+        self._max_save_timer.setInterval(auto_save_max_interval_ms)
+        self._max_save_timer.timeout.connect(self.save_to_yaml)
+
+        # Bumped whenever ds is replaced; invalidates the _ds_cached properties
+        self._ds_version = 0
+        self._ds_cache: dict[str, tuple[int, Any]] = {}
+
 
+    @cached_property
+    def settings(self):
+        """napari settings, resolved on first use rather than at construction."""
+        return get_settings()
 
+    @_ds_cached
+    def fps(self):
+        """Frame rate of the current dataset (ds.attrs['fps'])."""
+        return self._state.ds.attrs["fps"]
+
+    @_ds_cached
+    def time_values(self):
+        """Time coordinate of the current dataset as a NumPy array (treat as read-only)."""
+        return self._state.ds["time"].values
+
+    def invalidate_ds_cache(self):
+        """Drop the _ds_cached values, e.g. after ds was replaced via _state directly."""
+        self._ds_version += 1
 
     @property
     def sel_attrs(self) -> dict:
         """
         Return all attributes ending with _sel or _sel_previous as a dict.
         """
-        result = {}
-        for attr in dir(self):
-            if attr.endswith("_sel") or attr.endswith("_sel_previous"):
-                value = getattr(self, attr, None)
-                if not callable(value):
-                    result[attr] = value
-        return result
+        return {attr: self.__dict__.get(attr) for attr in sorted(self._sel_keys)}
     
 
     def get_with_default(self, key):
@@ -122,49 +404,71 @@ class ObservableAppState(QObject):
             value = AppStateSpec.get_default(key)
         return value
 
-    def __getattr__(self, name):
-        if name in AppStateSpec.VARS:
-            return getattr(self._state, name)
-        raise AttributeError(name)
-
     def __setattr__(self, name, value):
-        # Handle special attributes that don't go through state
-        if name in (
-            "_state",
-            "settings",
-            "_yaml_path",
-            "_auto_save_timer",
-            "navigation_widget",
-            "lineplot",
-        ):
-            super().__setattr__(name, value)
-            return
+        # Dynamic _sel attributes are saved too; state variables (the hot
+        # path, e.g. current_frame) skip the suffix test
+        if name not in _STATE_KEYS and name.endswith(_SEL_SUFFIXES):
+            self._sel_keys.add(name)
+            self._mark_dirty()
 
-        # Handle state variables
-        if name in AppStateSpec.VARS:
-            old_value = getattr(self._state, name, None)
-            setattr(self._state, name, value)
+        # State variables are properties, so this also routes to _set_state_var
+        super().__setattr__(name, value)
 
-            # Emit signal if value changed
-            signal = getattr(self, f"{name}_changed", None)
-            if signal and old_value != value:
-                signal.emit(value)
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        if name in self._sel_keys:
+            self._sel_keys.discard(name)
+            self._mark_dirty()
 
+    def _set_state_var(self, name, value):
+        """Store a state variable and emit its *_changed signal if it changed."""
+        old_value = getattr(self._state, name, None)
+        if old_value is value:
             return
 
-        # Handle other attributes
-        super().__setattr__(name, value)
+        # Datasets compare by identity; == would compare every element
+        if name in AppStateSpec.IDENTITY_VARS:
+            changed = True
+        else:
+            try:
+                changed = old_value != value
+                # Array-likes compare element-wise
+                if not isinstance(changed, bool):
+                    changed = bool(changed.any()) if hasattr(changed, "any") else bool(changed)
+            except (TypeError, ValueError):
+                changed = True
+
+        # Equal re-assignments (e.g. repeated napari step events) leave state untouched
+        if changed:
+            setattr(self._state, name, value)
+            if name == "ds":
+                self._ds_version += 1
+            if name in AppStateSpec.SAVEABLE:
+                self._mark_dirty()
+            self._SIGNAL_GETTERS[name](self).emit(value)
+
+    def _mark_dirty(self):
+        """Flag that saveable state changed since the last write."""
+        self._dirty = True
+        self._dirty_gen += 1
+        self._cached_save_dict = None
+        if self._auto_save_enabled:
+            self._auto_save_timer.start()
+            if not self._max_save_timer.isActive():
+                self._max_save_timer.start()
 
     # --- Dynamic _sel variables ---
     def get_ds_kwargs(self):
         ds_kwargs = {}
 
+        # One lookup per selection instead of hasattr + getattr
+        keypoints = getattr(self, "keypoints_sel", _MISSING)
+        if keypoints is not _MISSING and "keypoints" in self.ds.dims:
+            ds_kwargs["keypoints"] = keypoints
+        individuals = getattr(self, "individuals_sel", _MISSING)
+        if individuals is not _MISSING and "individuals" in self.ds.dims:
+            ds_kwargs["individuals"] = individuals
 
-        if hasattr(self, "keypoints_sel") and "keypoints" in self.ds.dims:
-            ds_kwargs["keypoints"] = self.keypoints_sel
-        if hasattr(self, "individuals_sel") and "individuals" in self.ds.dims:
-            ds_kwargs["individuals"] = self.individuals_sel
-            
         return ds_kwargs
             
 
@@ -230,80 +534,137 @@ class ObservableAppState(QObject):
                 combo.setCurrentText(str(new_value))
                 combo.currentTextChanged.emit(combo.currentText())
         except (AttributeError, TypeError) as e:
-            print(f"Error updating combo box for {type_key}: {e}")
+            logger.warning("Error updating combo box for %s: %s", type_key, e)
 
     # --- Save/Load methods ---
     def get_saveable_state_dict(self) -> dict:
+        # Rebuilt only after _mark_dirty(); treat the result as read-only
+        if self._cached_save_dict is not None:
+            return self._cached_save_dict
+
+        # Only str, float, int, or bool values are saved (numpy scalars unwrapped)
         state_dict = {}
-        for attr in self._state.saveable_attributes():
-            value = getattr(self._state, attr)
-            if value is not None:
-                # Only save if value is str, float, int, or bool
-                if isinstance(value, (str, float, int, bool)):
-                    state_dict[attr] = value
-        
-        # Save dynamic _sel attributes
-        for attr in dir(self):
-            if attr.endswith("_sel") or attr.endswith("_sel_previous"):
-                try:
-                    value = getattr(self, attr)
-                    if not callable(value) and value is not None:
-                        if isinstance(value, (str, float, int, bool)):
-                            state_dict[attr] = value
-                except (AttributeError, TypeError) as exc:
-                    print(f"Error accessing {attr}: {exc}")
+        for attr in AppStateSpec.SAVEABLE:
+            value = _coerce_scalar(getattr(self._state, attr))
+            if type(value) in _SCALAR_TYPES:
+                state_dict[attr] = value
+
+        # Save dynamic _sel attributes (sorted, matching the previous dir() order)
+        for attr in sorted(self._sel_keys):
+            value = _coerce_scalar(self.__dict__.get(attr))
+            if type(value) in _SCALAR_TYPES:
+                state_dict[attr] = value
+        self._cached_save_dict = state_dict
         return state_dict
 
 
     def load_from_dict(self, state_dict: dict):
+        setters = self._STATE_SETTERS
         for key, value in state_dict.items():
             if value is None:
                 continue
-            if key in AppStateSpec.VARS or key.endswith("_sel") or key.endswith("_sel_previous"):
+            fset = setters.get(key)
+            if fset is not None:
+                fset(self, value)
+            elif key.endswith(_SEL_SUFFIXES):
                 setattr(self, key, value)
 
-    def save_to_yaml(self, yaml_path: str | None = None) -> bool:
+    def save_to_yaml(
+        self, yaml_path: str | None = None, blocking: bool = False, fsync: bool = False
+    ) -> bool:
+        """Save saveable state to YAML.
+
+        The state is serialized on the calling thread and, unless blocking is
+        True, written by a background thread so disk I/O does not stall the GUI.
+        A background save only counts as done (state clean, _last_saved updated)
+        once _on_yaml_written reports success; True then means "queued".
+        Set fsync to force the file to disk before it replaces the old one.
+        """
         try:
-            path = yaml_path or self._yaml_path
+            # Nothing changed since the last autosave
+            if not self._dirty and yaml_path is None:
+                return True
+            path = str(yaml_path or self._yaml_path)
             state_dict = self.get_saveable_state_dict()
-            with open(path, "w", encoding="utf-8") as f:
-                yaml.dump(state_dict, f, default_flow_style=False, sort_keys=False)
+            if yaml_path is None:
+                self._auto_save_timer.stop()
+                self._max_save_timer.stop()
+            # File already holds this state (e.g. just loaded, or a change was reverted)
+            if self._last_saved == (path, state_dict):
+                self._dirty = False
+                return True
+            text = _dump_flat_yaml(state_dict)
+            if not blocking:
+                self._write_pool.start(_YamlWriteTask(
+                    path, text, dict(state_dict), self._dirty_gen, self._write_signals, fsync
+                ))
+                return True
+            _write_text_atomic(path, text, fsync)
+            self._last_saved = (path, dict(state_dict))
+            self._dirty = False
             return True
-        except (OSError, yaml.YAMLError) as e:
-            print(f"Error saving state to YAML: {e}")
+        except OSError as e:
+            logger.error("Error saving state to YAML: %s", e)
             return False
 
+    def _on_yaml_written(self, path: str, state_dict: dict, dirty_gen: int, ok: bool):
+        """Finish a background save on the GUI thread."""
+        # On failure the state stays dirty, so the next autosave or the final
+        # flush retries; a file deleted since (delete_yaml) is not "saved" either
+        if not ok or not os.path.exists(path):
+            return
+        self._last_saved = (path, state_dict)
+        if dirty_gen == self._dirty_gen:
+            self._dirty = False
+
     def load_from_yaml(self, yaml_path: str | None = None) -> bool:
         try:
             path = yaml_path or self._yaml_path
-            if not Path(path).exists():
-                print(f"YAML file {path} not found, using defaults")
+            try:
+                text = Path(path).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                logger.info("YAML file %s not found, using defaults", path)
                 return False
-            with open(path, encoding="utf-8") as f:
-                state_dict = yaml.safe_load(f) or {}
+            # Files written by this class take the fast path; others go through PyYAML
+            state_dict = _load_flat_yaml(text)
+            if state_dict is None:
+                state_dict = yaml.load(text, Loader=SafeLoader) or {}
             self.load_from_dict(state_dict)
-            print(f"State loaded from {path}")
+            # In-memory state now matches the file
+            self._last_saved = (str(path), dict(self.get_saveable_state_dict()))
+            self._dirty = False
+            logger.debug("State loaded from %s", path)
             return True
         except (OSError, yaml.YAMLError) as e:
-            print(f"Error loading state from YAML: {e}")
+            logger.error("Error loading state from YAML: %s", e)
             return False
         
     def delete_yaml(self, yaml_path: str | None = None) -> bool:
         try:
             path = yaml_path or self._yaml_path
             p = Path(path)
+            # A queued write must not recreate the file after it is deleted;
+            # bounded so a stalled disk cannot freeze the GUI thread
+            if not self._write_pool.waitForDone(2000):
+                logger.warning("Pending YAML write did not finish before deleting %s", path)
+            if self._last_saved is not None and self._last_saved[0] == str(path):
+                self._last_saved = None
             if p.exists():
                 p.unlink()
-                print(f"Deleted YAML file {path}")
+                logger.debug("Deleted YAML file %s", path)
                 return True
             else:
-                print(f"YAML file {path} does not exist")
+                logger.debug("YAML file %s does not exist", path)
                 return False
         except OSError as e:
-            print(f"Error deleting YAML file: {e}")
+            logger.error("Error deleting YAML file: %s", e)
             return False
     
     def stop_auto_save(self):
-        if self._auto_save_timer.isActive():
+        if self._auto_save_enabled:
+            self._auto_save_enabled = False
             self._auto_save_timer.stop()
-            self.save_to_yaml()
+            self._max_save_timer.stop()
+            # Let queued background writes finish before the final flush
+            self._write_pool.waitForDone(2000)
+            self.save_to_yaml(blocking=True)
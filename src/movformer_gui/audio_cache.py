@@ -1,19 +1,48 @@
 """Shared audio cache for efficient AudioLoader management."""
 
+import contextlib
+from collections import OrderedDict
+
 from audioio import AudioLoader
+from qtpy.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 import threading
 
 
+class _LoaderSignals(QObject):
+    """Carries a finished AudioLoader (or None) back to the GUI thread."""
+
+    finished = Signal(object)
+
+
+class _LoaderTask(QRunnable):
+    """Open an AudioLoader through the shared cache on a pool thread."""
+
+    def __init__(self, audio_path, buffer_size, signals):
+        super().__init__()
+        self.audio_path = audio_path
+        self.buffer_size = buffer_size
+        self.signals = signals
+
+    def run(self):
+        loader = SharedAudioCache.get_loader(self.audio_path, self.buffer_size)
+        self.signals.finished.emit(loader)
+
+
 class SharedAudioCache:
     """Singleton cache for AudioLoader instances.
     
     This prevents repeatedly opening/closing audio files when computing
     spectrograms or accessing audio data from different parts of the application.
-    Thread-safe implementation.
+    Thread-safe implementation. At most ``_MAX`` loaders are cached; beyond that
+    the least recently used one is dropped from the cache. Evicted loaders are
+    not closed here, since other threads may still be reading from them; they
+    are finalized once the last reference goes away.
     """
     
-    _instances = {}
+    _instances = OrderedDict()
     _lock = threading.Lock()
+    _MAX = 8
+    _pending = set()  # keeps signal emitters alive until their task reports back
     
     @classmethod
     def get_loader(cls, audio_path, buffer_size=10.0):
@@ -33,25 +62,53 @@ class SharedAudioCache:
         """
         if not audio_path:
             return None
-            
+
+        # Hit path without the lock; dict reads are atomic under the GIL
+        loader = cls._instances.get(audio_path)
+        if loader is not None:
+            # Evicted concurrently: the loader is not closed, so it stays usable
+            with contextlib.suppress(KeyError):
+                cls._instances.move_to_end(audio_path)
+            return loader
+
         with cls._lock:
-            if audio_path not in cls._instances:
+            loader = cls._instances.get(audio_path)
+            if loader is None:
                 try:
-                    cls._instances[audio_path] = AudioLoader(audio_path, buffersize=buffer_size)
+                    loader = AudioLoader(audio_path, buffersize=buffer_size)
                 except Exception as e:
                     print(f"Failed to load audio file {audio_path}: {e}")
                     return None
-            return cls._instances[audio_path]
+                while len(cls._instances) >= cls._MAX:
+                    cls._instances.popitem(last=False)
+                cls._instances[audio_path] = loader
+            return loader
     
+    @classmethod
+    def get_loader_async(cls, audio_path, callback=None, buffer_size=10.0):
+        """Open the AudioLoader for ``audio_path`` in the global thread pool.
+
+        Opening large files can take a noticeable time, so this warms the cache
+        without blocking the GUI. ``callback(loader)`` is invoked on the GUI
+        thread once the loader is ready (``loader`` is None on failure).
+        """
+        if not audio_path:
+            return
+        signals = _LoaderSignals()
+        if callback is not None:
+            signals.finished.connect(callback, Qt.QueuedConnection)
+        cls._pending.add(signals)
+        signals.finished.connect(lambda _: cls._pending.discard(signals), Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(_LoaderTask(audio_path, buffer_size, signals))
+
     @classmethod
     def clear_cache(cls):
-        """Clear all cached AudioLoader instances."""
+        """Drop all cached AudioLoader instances (without closing loaders still in use)."""
         with cls._lock:
             cls._instances.clear()
     
     @classmethod
     def remove_loader(cls, audio_path):
-        """Remove specific AudioLoader from cache."""
+        """Remove specific AudioLoader from cache (without closing it)."""
         with cls._lock:
-            if audio_path in cls._instances:
-                del cls._instances[audio_path]
\ No newline at end of file
+            cls._instances.pop(audio_path, None)
\ No newline at end of file
@@ -71,9 +71,12 @@ def load_dataset(file_path: str) -> Tuple[Optional[xr.Dataset], Optional[dict]]:
 
     type_vars_dict['individuals'] = ds.coords['individuals'].values.astype(str)
 
+    # Group data variables by their 'type' attribute in a single pass
+    vars_by_type = {}
+    for var_name, var in ds.data_vars.items():
+        vars_by_type.setdefault(var.attrs.get('type'), []).append(var_name)
 
-    feat_ds = ds.filter_by_attrs(type='features')
-    type_vars_dict['features'] = list(feat_ds.data_vars)
+    type_vars_dict['features'] = vars_by_type.get('features', [])
     
     type_vars_dict['cameras'] = list(dt.attrs.get('cameras', []))
     
@@ -90,13 +93,13 @@ def load_dataset(file_path: str) -> Tuple[Optional[xr.Dataset], Optional[dict]]:
     if 'keypoints' in ds.coords:
         type_vars_dict['keypoints'] = ds.coords['keypoints'].values.astype(str)
     
-    color_ds = ds.filter_by_attrs(type='colors')
-    if not color_ds.data_vars:
-        type_vars_dict['colors'] = list(color_ds.data_vars)
+    color_vars = vars_by_type.get('colors', [])
+    if not color_vars:
+        type_vars_dict['colors'] = color_vars
     
-    cp_ds = ds.filter_by_attrs(type='changepoints')
-    if not cp_ds.data_vars:
-        type_vars_dict['changepoints'] = list(cp_ds.data_vars)
+    cp_vars = vars_by_type.get('changepoints', [])
+    if not cp_vars:
+        type_vars_dict['changepoints'] = cp_vars
 
 
     type_vars_dict["trial_conditions"] = possible_trial_conditions(dt)
@@ -117,20 +120,22 @@ def possible_trial_conditions(dt: xr.DataTree) -> List[str]:
     ds = dt.isel(trials=0)
     
     
-    common_extensions = {
+    common_extensions = frozenset({
         '.csv', '.mp4', '.avi', '.mov', '.h5', '.hdf5', 
         '.wav', '.mp3', '.npy',
-    }
+    })
     
-    common_attrs = dt.get_common_attrs().keys()
+    skip = frozenset(dt.get_common_attrs()) | {'trial'}
     
     cond_attrs = []
     for key, value in ds.attrs.items():
-        if key in ['trial'] or key in common_attrs:
+        if key in skip:
             continue
         
         if isinstance(value, str):
-            if Path(value).suffix.lower() in common_extensions:
+            # Same as Path(value).suffix, without building a Path per attribute
+            dot = value.rfind('.')
+            if dot > 0 and value[dot - 1] not in '/\\' and value[dot:].lower() in common_extensions:
                 continue
             
         cond_attrs.append(key)
@@ -160,34 +165,44 @@ def validate_dataset(ds: xr.Dataset, type_vars_dict: dict) -> bool:
     if "labels" not in ds.data_vars:
         validation_errors.append("Dataset must contain 'labels' variable")
           
-    if "mics" in type_vars_dict and not hasattr(ds, "sr"):
+    if "mics" in type_vars_dict and "sr" not in ds.attrs:
         validation_errors.append("Dataset must have 'sr' (for sampling rate) attribute for microphone processing.")
 
 
 
     labels = ds['labels'].values 
     
-    def is_integer_labels(arr: np.ndarray) -> bool:
+    def is_integer_labels(arr: np.ndarray, block_size: int = 1 << 16) -> bool:
         """Check if the array contains only integer values (no fractional part)."""
-        if np.issubdtype(arr.dtype, np.floating):
-            return np.all(np.mod(arr, 1) == 0)
-        return np.issubdtype(arr.dtype, np.integer)
+        kind = arr.dtype.kind
+        if kind != 'f':
+            return kind in ('i', 'u')
+        # Floor block by block into one scratch buffer: no full-size temporaries,
+        # and stop at the first block with a fractional value (or NaN/inf)
+        flat = np.ravel(arr)
+        scratch = np.empty(min(block_size, flat.size), dtype=flat.dtype)
+        for start in range(0, flat.size, block_size):
+            block = flat[start:start + block_size]
+            floored = np.floor(block, out=scratch[:block.size])
+            if not np.array_equal(floored, block) or not np.isfinite(floored).all():
+                return False
+        return True
 
     if not is_integer_labels(labels):
         validation_errors.append("Variable 'labels' must contain integer values (no fractional part)")
     
     
     
-    feat_ds = ds.filter_by_attrs(type='features')
-    for var_name, var in feat_ds.data_vars.items():
-        if not isinstance(var.values, np.ndarray):
+    for var_name in type_vars_dict.get('features', []):
+        var = ds[var_name]
+        # Shape metadata only; reading .values would load every feature into memory
+        if var.ndim == 0:
             validation_errors.append(f"Variable '{var.name}' with type 'features' must be an array")
     
     
     if "changepoints" in type_vars_dict:
-        cp_ds = ds.filter_by_attrs(type='changepoints')
-
-        for var_name, var in cp_ds.data_vars.items():
+        for var_name in type_vars_dict['changepoints']:
+            var = ds[var_name]
             arr = var.values
 
             if not is_integer_labels(arr):
@@ -202,18 +217,20 @@ def validate_dataset(ds: xr.Dataset, type_vars_dict: dict) -> bool:
  
     
     if 'colors' in type_vars_dict:
-        cp_ds = ds.filter_by_attrs(type='colors')
-
-        for var_name, data_array in cp_ds.data_vars.items():
-            flat = data_array.transpose(..., 'RGB').values.reshape(-1, 3)
+        for var_name in type_vars_dict['colors']:
+            data_array = ds[var_name]
+            # Check the RGB dim size and reduce in place; no transposed/flattened copy
+            # skipna=False: a NaN colour must fail the range check, not be ignored
+            lo = float(data_array.min(skipna=False))
+            hi = float(data_array.max(skipna=False))
             
             is_valid_rgb = (
-                flat.shape[1] == 3 and
-                ((0 <= flat.min() <= flat.max() <= 1) or 
-                (0 <= flat.min() <= flat.max() <= 255))
+                data_array.sizes.get('RGB') == 3 and
+                ((0 <= lo <= hi <= 1) or 
+                (0 <= lo <= hi <= 255))
             )
             if is_valid_rgb:
-                print(f"{var_name}: {flat.shape} | Valid RGB: {is_valid_rgb} | Range: [{flat.min():.1f}, {flat.max():.1f}]")
+                print(f"{var_name}: {data_array.shape} | Valid RGB: {is_valid_rgb} | Range: [{lo:.1f}, {hi:.1f}]")
             else:
                 validation_errors.append(
                     f"Data variable '{var_name}' with type 'colors' must be an array of RGB values with shape (..., 3) "
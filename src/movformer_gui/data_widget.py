@@ -513,17 +513,23 @@ class DataWidget(DataLoader, QWidget):
         self.app_state.video_path = os.path.normpath(video_path)
 
         # Set up audio path if available
+        previous_audio_path = self.app_state.audio_path
         audio_path = None
         if self.app_state.audio_folder and hasattr(self.app_state, 'mics_sel'):
             try:
                 audio_file = (
                     self.app_state.ds.attrs[self.app_state.mics_sel]
                 )
-                audio_path = os.path.join(self.app_state.audio_folder, audio_file)
-                self.app_state.audio_path = os.path.normpath(audio_path)
+                audio_path = os.path.normpath(os.path.join(self.app_state.audio_folder, audio_file))
+                self.app_state.audio_path = audio_path
             except (KeyError, AttributeError):
                 self.app_state.audio_path = None
 
+        # Open this trial's audio file in the background so the first
+        # spectrogram/playback hits the cache
+        if audio_path and audio_path != previous_audio_path:
+            SharedAudioCache.get_loader_async(audio_path)
+
 
         
  
@@ -607,6 +613,9 @@ class DataWidget(DataLoader, QWidget):
         """Handle frame changes from sync manager."""
         self.app_state.current_frame = frame_number
         self.lineplot.update_time_marker_and_window(frame_number)
+        # Hidden plot: the line plot catches up in its showEvent
+        if not self.lineplot.isVisible():
+            return
         
         # Update window continously
         if self.app_state.sync_state == "pyav_stream_mode":
@@ -615,7 +624,7 @@ class DataWidget(DataLoader, QWidget):
             
         # Only update if out of bounds
         elif self.app_state.sync_state == "napari_video_mode":
-            current_time = frame_number / self.app_state.ds.fps
+            current_time = frame_number / self.app_state.fps
             xlim = self.lineplot.get_current_xlim()
             if current_time < xlim[0] or current_time > xlim[1]:
                 self.lineplot.set_x_range(mode='center', center_on_frame=frame_number)
@@ -635,7 +644,7 @@ class DataWidget(DataLoader, QWidget):
             ]:
                 self.viewer.layers.remove(layer)
 
-        self.fps = self.app_state.ds.fps
+        self.fps = self.app_state.fps
         self.source_software = self.app_state.ds.source_software
 
         tracking_file = (
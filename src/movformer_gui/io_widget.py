@@ -59,16 +59,16 @@ class IOWidget(QWidget):
         self.app_state.delete_yaml()
         
         # Reset all app_state attributes to their defaults
-        for var, (var_type, default, _, _) in AppStateSpec.VARS.items():
+        for var, default in AppStateSpec.DEFAULTS.items():
             setattr(self.app_state._state, var, default)
+        self.app_state.invalidate_ds_cache()
         
         # Clear all dynamic _sel attributes
-        for attr in list(dir(self.app_state)):
-            if attr.endswith("_sel") or attr.endswith("_sel_previous"):
-                try:
-                    delattr(self.app_state, attr)
-                except AttributeError:
-                    pass
+        for attr in list(self.app_state._sel_keys):
+            try:
+                delattr(self.app_state, attr)
+            except AttributeError:
+                pass
         
         self._clear_all_line_edits()
         self._clear_combo_boxes()
@@ -78,6 +78,7 @@ class IOWidget(QWidget):
         
         yaml_path = self._default_yaml_path()
         self.app_state._yaml_path = str(yaml_path)
+        self.app_state._mark_dirty()
         self.app_state.save_to_yaml()
   
   
@@ -44,6 +44,23 @@ from qtpy.QtCore import Signal
 
 
 
+def _motif_runs(labels):
+    """Run-length encode labels into (starts, ends, motif_ids) of the non-zero runs.
+
+    ends are inclusive sample indices; each run of equal values is one segment.
+    """
+    labels = np.asarray(labels)
+    if labels.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, labels[:0]
+
+    run_starts = np.concatenate(([0], np.flatnonzero(np.diff(labels)) + 1))
+    run_ends = np.append(run_starts[1:], labels.size) - 1
+    run_ids = labels[run_starts]
+    is_motif = run_ids != 0
+    return run_starts[is_motif], run_ends[is_motif], run_ids[is_motif]
+
+
 class LabelsWidget(QWidget):
     """Widget for labeling movement motifs in time series data."""
     
@@ -128,35 +145,8 @@ class LabelsWidget(QWidget):
             self.lineplot.label_items.clear()
 
         try:
-            # Find all labeled segments and plot them
-            current_motif_id = 0
-            segment_start = None
-
-            for i, label in enumerate(labels):
-                if label != 0:  # Start of a motif or continuing one
-                    if label != current_motif_id:  # New motif starts
-                        # End previous motif if it exists
-                        if current_motif_id != 0 and segment_start is not None:
-                            self._draw_motif_rectangle(
-                                time_data[segment_start],
-                                time_data[i - 1],
-                                current_motif_id,
-                                None,  # ylim not needed for PyQtGraph
-                            )
-
-                        # Start new motif
-                        current_motif_id = label
-                        segment_start = i
-
-                else:  # End of current motif
-                    if current_motif_id != 0 and segment_start is not None:
-                        self._draw_motif_rectangle(time_data[segment_start], time_data[i - 1], current_motif_id, None)
-                        current_motif_id = 0
-                        segment_start = None
-
-            # Handle case where motif continues to the end
-            if current_motif_id != 0 and segment_start is not None:
-                self._draw_motif_rectangle(time_data[segment_start], time_data[-1], current_motif_id, None)
+            for start, end, motif_id in zip(*_motif_runs(labels), strict=True):
+                self._draw_motif_rectangle(time_data[start], time_data[end], motif_id, None)
 
         except (KeyError, IndexError, AttributeError) as e:
             print(f"Error plotting motifs: {e}")
@@ -420,7 +410,7 @@ class LabelsWidget(QWidget):
 
         # Handle right-click - play video of motif if clicking on one
         elif button == Qt.RightButton:
-            frame = int(x_clicked * self.app_state.ds.fps)
+            frame = int(x_clicked * self.app_state.fps)
             self.data_widget.sync_manager.seek_to_frame(frame)
 
         
@@ -428,7 +418,7 @@ class LabelsWidget(QWidget):
         elif button == Qt.LeftButton and self.ready_for_label_click:
     
             # Snap to nearest changepoint if available
-            x_clicked_idx = int(x_clicked * self.app_state.ds.fps)  # Convert to frame index
+            x_clicked_idx = int(x_clicked * self.app_state.fps)  # Convert to frame index
             x_snapped = self._snap_to_changepoint(x_clicked_idx)
 
 
@@ -446,7 +436,7 @@ class LabelsWidget(QWidget):
         """Check if the click is on an existing motif and select it if so. Move left and right until you find its start and stop idxs."""
 
         # Check if there's a motif at this position
-        frame_idx = int(x_clicked * self.app_state.ds.fps)
+        frame_idx = int(x_clicked * self.app_state.fps)
         motif_id = int(labels[frame_idx])
 
         if motif_id != 0:
@@ -473,9 +463,8 @@ class LabelsWidget(QWidget):
     def _snap_to_changepoint(self, x_clicked_idx: float) -> float:
         """Snap the clicked x-coordinate to the nearest changepoint."""
 
-        ds_kwargs = self.app_state.get_ds_kwargs()
-
-        cp_ds = self.app_state.ds.sel(**ds_kwargs).filter_by_attrs(type="changepoints")
+        # Only the presence of changepoint variables matters here, so skip the .sel copy
+        cp_ds = self.app_state.ds.filter_by_attrs(type="changepoints")
         if len(cp_ds.data_vars) == 0:
             return x_clicked_idx
 
@@ -531,7 +520,7 @@ class LabelsWidget(QWidget):
             self._mark_changes_unsaved()
 
    
-            time_data = self.app_state.ds.time.values
+            time_data = self.app_state.time_values
             self.plot_all_motifs(time_data, labels)
             
             # Refresh the shapes layer to show updated motifs
@@ -568,7 +557,7 @@ class LabelsWidget(QWidget):
             self._mark_changes_unsaved()
 
     
-            time_data = self.app_state.ds.time.values
+            time_data = self.app_state.time_values
             self.plot_all_motifs(time_data, labels)
             
             # Refresh the shapes layer to show updated motifs
@@ -73,6 +73,9 @@ class LinePlot(QWidget):
         # Reference to plots widget for updating controls
         self.plots_widget = None
 
+        # Frame updates are skipped while hidden and replayed from showEvent
+        self._pending_frame = None
+
     
     def set_stream_mode(self) -> None:
         """Configure plot for video-sync mode (limited user interaction).
@@ -164,16 +167,16 @@ class LinePlot(QWidget):
             curr_xlim: tuple (xmin, xmax) to preserve
             center_on_frame: frame number to center on
         """
-        time = self.app_state.ds.time.values
+        time = self.app_state.time_values
         
         if mode == 'center':
             if not hasattr(self.app_state, 'window_size'):
                 return
                 
             if center_on_frame is not None:
-                current_time = center_on_frame / self.app_state.ds.fps
+                current_time = center_on_frame / self.app_state.fps
             else:
-                current_time = self.app_state.current_frame / self.app_state.ds.fps
+                current_time = self.app_state.current_frame / self.app_state.fps
             
             window_size = self.app_state.get_with_default('window_size')
             half_window = window_size / 2.0
@@ -198,10 +201,17 @@ class LinePlot(QWidget):
         if not hasattr(self.app_state, 'current_frame') or not hasattr(self.app_state, 'ds') or self.app_state.ds is None:
             return
             
-        current_time = frame_number / self.app_state.ds.fps
+        if not self.isVisible():
+            self._pending_frame = frame_number
+            return
+
+        current_time = frame_number / self.app_state.fps
+        # Per-frame path: only move the marker, the plotted curves stay untouched
         self.time_marker.setValue(current_time)
-        self.time_marker.show()
-        self.time_marker.setZValue(1000)
+        if not self.time_marker.isVisible():
+            self.time_marker.show()
+        if self.time_marker.zValue() != 1000:
+            self.time_marker.setZValue(1000)
         
 
 
@@ -211,13 +221,24 @@ class LinePlot(QWidget):
             
             
         
+    def showEvent(self, event):
+        super().showEvent(event)
+        frame_number, self._pending_frame = self._pending_frame, None
+        if frame_number is None or self.app_state.ds is None:
+            return
+        self.update_time_marker_and_window(frame_number)
+        xlim = self.get_current_xlim()
+        current_time = frame_number / self.app_state.fps
+        if current_time < xlim[0] or current_time > xlim[1]:
+            self.set_x_range(mode='center', center_on_frame=frame_number)
+
     def _apply_zoom_constraints(self):
         """Apply data-aware zoom constraints to the plot viewbox."""
 
     
 
 
-        time = self.app_state.ds.time.values        
+        time = self.app_state.time_values        
         xMin = time[0]
         xMax = time[-1]
         xRange = xMax - xMin
@@ -27,23 +27,37 @@ class MultiColoredLineItem(pg.GraphicsObject):
     def generatePicture(self):
         self.picture = pg.QtGui.QPicture()
         painter = pg.QtGui.QPainter(self.picture)
-        
-        for i in range(len(self.x) - 1):
-            if i < len(self.colors):
-                color = self.colors[i]
-                if max(color) <= 1:
-                    color = tuple(int(c * 255) for c in color)
-            else:
-                color = (255, 255, 255)
-            
-            pen = pg.mkPen(color=color, width=self.width)
-            painter.setPen(pen)
-            painter.drawLine(
-                pg.QtCore.QPointF(self.x[i], self.y[i]),
-                pg.QtCore.QPointF(self.x[i+1], self.y[i+1])
-            )
-        
+
+        x = np.asarray(self.x, dtype=float)
+        y = np.asarray(self.y, dtype=float)
+        n_segments = len(x) - 1
+
+        if n_segments > 0:
+            segment_colors = self._segment_colors(n_segments)
+            unique_colors, color_idx = np.unique(segment_colors, axis=0, return_inverse=True)
+            color_idx = color_idx.ravel()
+
+            # One pen and one drawLines call per distinct colour
+            order = np.argsort(color_idx, kind="stable")
+            groups = np.split(order, np.flatnonzero(np.diff(color_idx[order])) + 1)
+            for color, segments in zip(unique_colors, groups, strict=True):
+                painter.setPen(pg.mkPen(color=tuple(int(c) for c in color), width=self.width))
+                painter.drawLines([
+                    pg.QtCore.QLineF(x[i], y[i], x[i + 1], y[i + 1]) for i in segments
+                ])
+
         painter.end()
+
+    def _segment_colors(self, n_segments):
+        """Return an (n_segments, 3) integer RGB array, padding missing colours with white."""
+        colors = np.full((n_segments, 3), 255.0)
+        if self.colors is None or len(self.colors) == 0:
+            return colors.astype(int)
+        given = np.asarray(self.colors, dtype=float)[:n_segments, :3]
+        is_normalized = given.max(axis=1, initial=0) <= 1
+        given = np.where(is_normalized[:, None], given * 255, given)
+        colors[: len(given)] = given
+        return colors.astype(int)
     
     def paint(self, painter, *args):
         painter.drawPicture(0, 0, self.picture)
@@ -53,29 +67,33 @@ class MultiColoredLineItem(pg.GraphicsObject):
     
     
     
+# Motif palette in 0-255 RGB (PyQtGraph format), stored compactly as uint8
+_MOTIF_COLORS_RGB = np.array([
+    [255, 255, 255],
+    [255, 102, 178],
+    [102, 158, 255],
+    [153, 51, 255],
+    [255, 51, 51],
+    [102, 255, 102],
+    [255, 153, 102],
+    [0, 153, 0],
+    [0, 0, 128],
+    [255, 255, 0],
+    [0, 204, 204],
+    [128, 128, 0],
+    [255, 0, 255],
+    [255, 165, 0],
+    [0, 128, 255],
+    [128, 0, 255],
+    [255, 128, 0],
+], dtype=np.uint8)
+_MOTIF_COLORS_RGB.setflags(write=False)
+
+
 def get_motif_colours(seed=9):
     """Get motif colors - same as original but formatted for PyQtGraph (0-255 RGB)."""
-    # Already in 0-255 format which PyQtGraph uses
-    category_colors_rgb = [
-        [255, 255, 255],
-        [255, 102, 178],
-        [102, 158, 255],
-        [153, 51, 255],
-        [255, 51, 51],
-        [102, 255, 102],
-        [255, 153, 102],
-        [0, 153, 0],
-        [0, 0, 128],
-        [255, 255, 0],
-        [0, 204, 204],
-        [128, 128, 0],
-        [255, 0, 255],
-        [255, 165, 0],
-        [0, 128, 255],      
-        [128, 0, 255],      
-        [255, 128, 0]       
-    ]
-    return category_colors_rgb
+    # Fresh list per call, so callers may modify it without touching the palette
+    return _MOTIF_COLORS_RGB.tolist()
 
 
 def plot_multidim(plot_item, time, data, coord_labels=None, existing_curves=None):
@@ -167,6 +185,15 @@ def plot_singledim(plot_item, time, data, color_data=None, changepoints_dict=Non
     return existing_items
 
 
+def _get_boundary_event_times(ds, time):
+    """Return the times of valid boundary events in ds."""
+    boundary_events_raw = ds["boundary_events"].values
+    # Single pass: NaN compares False, and > -1 matches int() truncation towards zero
+    valid = (boundary_events_raw > -1) & (boundary_events_raw < len(time))
+    eventsIdxs = boundary_events_raw[valid].astype(np.intp)
+    return time[eventsIdxs]
+
+
 def plot_ds_variable(plot_item, ds, ds_kwargs, variable, color_variable=None):
     """
     Plot a variable from ds for a given trial and keypoint using PyQtGraph.
@@ -196,11 +223,12 @@ def plot_ds_variable(plot_item, ds, ds_kwargs, variable, color_variable=None):
     time = ds["time"].values
 
     data, filt_kwargs = sel_valid(var, ds_kwargs)
-    var = var.sel(**filt_kwargs)
     plot_items = []
 
     if data.ndim == 2:
-        coord_labels = var.coords[var.dims[-1]].values
+        # Only the coordinate labels need the selected DataArray
+        sel_var = var.sel(**filt_kwargs)
+        coord_labels = sel_var.coords[sel_var.dims[-1]].values
         plot_items = plot_multidim(plot_item, time, data, coord_labels, plot_items)
 
     elif data.ndim == 1:
@@ -216,8 +244,10 @@ def plot_ds_variable(plot_item, ds, ds_kwargs, variable, color_variable=None):
             cp_ds = ds.filter_by_attrs(type="changepoints")
             for cp_var_name in cp_ds.data_vars:
                 cp_var = cp_ds[cp_var_name]
+                if cp_var.attrs.get("target_feature") != variable:
+                    continue
                 cp_data = cp_var.sel(**ds_kwargs).values
-                if cp_var.attrs.get("target_feature") == variable and not np.isnan(cp_data).all():
+                if not np.isnan(cp_data).all():
                     changepoints_dict[cp_var_name] = cp_data
 
         plot_items = plot_singledim(
@@ -230,17 +260,13 @@ def plot_ds_variable(plot_item, ds, ds_kwargs, variable, color_variable=None):
         print(f"Variable '{variable}' not supported for plotting.")
     
     # Add boundary events as vertical lines
-    if hasattr(ds, "boundary_events"):
-        boundary_events_raw = ds["boundary_events"].values
-        valid_events = boundary_events_raw[~np.isnan(boundary_events_raw)]
-        eventsIdxs = valid_events.astype(int)
-        eventsIdxs = eventsIdxs[(eventsIdxs >= 0) & (eventsIdxs < len(time))]
-        
-        for event in eventsIdxs:
+    if "boundary_events" in ds:
+        event_pen = pg.mkPen('k', width=2)
+        for event_time in _get_boundary_event_times(ds, time):
             vline = pg.InfiniteLine(
-                pos=time[event], 
+                pos=event_time, 
                 angle=90, 
-                pen=pg.mkPen('k', width=2)
+                pen=event_pen
             )
             plot_item.addItem(vline)
             plot_items.append(vline)
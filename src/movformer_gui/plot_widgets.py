@@ -226,7 +226,7 @@ class PlotsWidget(QWidget):
             return
 
         self.curr_xlim = self.lineplot.get_current_xlim()
-        self.current_time = self.app_state.current_frame / self.app_state.ds.fps
+        self.current_time = self.app_state.current_frame / self.app_state.fps
         window_size = self.app_state.get_with_default("window_size")
         half_window = window_size / 2
 
@@ -73,7 +73,7 @@ class SpacePlot(QWidget):
         if not self.app_state.ds:
             return
 
-        if not hasattr(self.app_state.ds, 'position') or 'x' not in self.app_state.ds.coords["space"] or 'y' not in self.app_state.ds.coords["space"]:
+        if 'position' not in self.app_state.ds or 'x' not in self.app_state.ds.coords["space"] or 'y' not in self.app_state.ds.coords["space"]:
             raise ValueError("Dataset must have 'position' variable with 'x' and 'y' coordinates for space plots")
 
 
@@ -110,7 +110,7 @@ class SpacePlot(QWidget):
     
     def _plot_centroid_trajectory(self, individual: str, keypoints: str):
         """Create centroid trajectory plot."""
-        if not hasattr(self.app_state.ds, 'position'):
+        if 'position' not in self.app_state.ds:
             raise ValueError("Dataset must have 'position' variable for centroid trajectory plot")
             
         # Select data for the specific trial
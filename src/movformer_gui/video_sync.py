@@ -17,6 +17,8 @@ from napari.utils.notifications import show_error
 from napari.settings import get_settings
 from audioio import AudioLoader, PlayAudio
 
+from .audio_cache import SharedAudioCache
+
 try:
     from napari._qt.qt_viewer import QtViewer
     from napari._qt._qapp_model.qactions._view import _get_current_play_status
@@ -43,7 +45,8 @@ class VideoSync(QObject):
         self.total_frames = 0
         self.total_duration = 0.0
         
-        self.sr = getattr(app_state.ds, 'sr', None) if hasattr(app_state, 'ds') else None
+        ds = getattr(app_state, 'ds', None)
+        self.sr = ds.attrs.get('sr') if ds is not None else None
         if self.sr is None and audio_source:
             try:
                 with AudioLoader(audio_source) as data:
@@ -54,7 +57,7 @@ class VideoSync(QObject):
     @property
     def fps(self) -> float:
         """Video's actual framerate from dataset."""
-        return self.app_state.ds.fps
+        return self.app_state.fps
     
     @property
     def fps_playback(self) -> float:
@@ -84,6 +87,9 @@ class NapariVideoSync(VideoSync):
     
     stop_playback_signal = Signal()
 
+    # Minimum seconds between frame updates forwarded from napari's dims slider
+    _STEP_MIN_INTERVAL = 0.05
+
     
     def __init__(self, viewer: napari.Viewer, app_state, video_source: str, audio_source: Optional[str] = None):
         super().__init__(viewer, app_state, video_source, audio_source)
@@ -97,6 +103,15 @@ class NapariVideoSync(VideoSync):
         self._monitor_timer = QTimer()
 
         self._monitor_end_frame = 0
+
+        # Throttle state for dims current_step events: the timer is the
+        # throttle window, _step_pending marks a frame held back during it
+        self._last_step_frame = None
+        self._step_pending = False
+        self._step_timer = QTimer()
+        self._step_timer.setSingleShot(True)
+        self._step_timer.setInterval(int(self._STEP_MIN_INTERVAL * 1000))
+        self._step_timer.timeout.connect(self._flush_step_change)
         
         self._setup_video_layer()
     
@@ -124,9 +139,30 @@ class NapariVideoSync(VideoSync):
         self.viewer.dims.events.current_step.connect(self._on_napari_step_change)
     
     def _on_napari_step_change(self, event=None):
-        if hasattr(self.viewer.dims, 'current_step') and len(self.viewer.dims.current_step) > 0:
-            frame_number = self.viewer.dims.current_step[0]
-            self._emit_frame_changed(frame_number)
+        current_step = getattr(self.viewer.dims, 'current_step', ())
+        if not current_step:
+            return
+        frame_number = current_step[0]
+        # Steps on other axes leave the frame unchanged
+        if frame_number == self._last_step_frame:
+            return
+        self._last_step_frame = frame_number
+
+        if self._step_timer.isActive():
+            # Inside the window: hold the frame for the trailing update
+            self._step_pending = True
+            return
+        # Leading edge: forward at once and open a new throttle window
+        self._emit_frame_changed(frame_number)
+        self._step_timer.start()
+
+    def _flush_step_change(self):
+        # Trailing edge, so the last frame of a fast scrub is always delivered
+        if not self._step_pending:
+            return
+        self._step_pending = False
+        self._emit_frame_changed(self._last_step_frame)
+        self._step_timer.start()
             
 
     
@@ -168,13 +204,13 @@ class NapariVideoSync(VideoSync):
         self.seek_to_frame(start_frame)
         self._monitor_end_frame = end_frame
         
-        if self.audio_source and self.sr:
-            with AudioLoader(self.audio_source) as data:
-                start_sample = int(start_time * self.sr)
-                end_sample = int(end_time * self.sr)
-                segment = data[start_sample:end_sample]
-
-            if segment.shape[0] > 1:
+        loader = SharedAudioCache.get_loader(self.audio_source) if self.audio_source and self.sr else None
+        if loader is not None:
+            start_sample = int(start_time * self.sr)
+            end_sample = int(end_time * self.sr)
+            # Reuse the already opened, buffered loader and keep only the first channel
+            segment = loader[start_sample:end_sample]
+            if segment.ndim > 1:
                 segment = segment[:, 0]
 
             slow_down_factor = self.fps_playback / self.fps
@@ -196,7 +232,10 @@ class NapariVideoSync(VideoSync):
                     del self._audio_player
                 return
                 
-            if self.app_state.current_frame >= self._monitor_end_frame:
+            # Read napari's live step: current_frame lags behind by up to _STEP_MIN_INTERVAL
+            current_step = self.viewer.dims.current_step
+            current_frame = current_step[0] if current_step else self.app_state.current_frame
+            if current_frame >= self._monitor_end_frame:
                 self._monitor_timer.stop()
                 self.stop_playback_signal.emit()
  
@@ -238,7 +277,7 @@ class VideoSliderWidget(QWidget):
         self.slider.setMaximum(self.total_frames - 1)
         self.slider.setValue(0)
         self.slider.setSingleStep(1)
-        self.slider.setPageStep(int(self.app_state.ds.fps) if self.app_state else 30)
+        self.slider.setPageStep(int(self.app_state.fps) if self.app_state else 30)
         self.slider.valueChanged.connect(self._on_slider_changed)
         
         self.current_frame_input = QLineEdit()
@@ -432,7 +471,8 @@ class AudioPlaybackThread(QThread):
                         if frame_time < self.start_position:
                             continue
                             
-                        audio_data = frame.to_ndarray().astype(np.int16).tobytes()
+                        # No intermediate copy when the decoder already yields int16 (s16/s16p)
+                        audio_data = frame.to_ndarray().astype(np.int16, copy=False).tobytes()
                         if self.audio_output:
                             self.audio_output.write(audio_data)
                             